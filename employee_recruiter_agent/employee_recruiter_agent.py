@@ -12,26 +12,177 @@ Features:
 """
 
 import asyncio
-import io
+import atexit
+import functools
+import hashlib
+import logging
 import os
 import random
 import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
+import aiohttp
+import diskcache
+import httpx
+import orjson
+import pymupdf
 import requests
 from agno.agent import Agent
+from agno.exceptions import ModelProviderError
 from agno.models.openrouter import OpenRouter
+from agno.run.base import RunStatus
 from agno.utils.log import logger
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
+from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
-from pypdf import PdfReader
 
 # Load environment variables from .env file
 load_dotenv()
 
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+OPENROUTER_MODEL_ID = os.getenv("OPENROUTER_MODEL_ID", "minimax/minimax-m2:free")
+
+# Verbose agent logging of full prompts/responses (off by default)
+RECRUITER_DEBUG = os.getenv("RECRUITER_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Route email sending through the Email Sender Agent instead of calling the tool directly
+RECRUITER_USE_EMAIL_AGENT = os.getenv("RECRUITER_USE_EMAIL_AGENT", "").lower() in ("1", "true", "yes")
+
+# Maximum number of concurrent LLM requests (respects OpenRouter rate limits)
+RECRUITER_CONCURRENCY = int(os.getenv("RECRUITER_CONCURRENCY", "10"))
+
+# Optional OpenRouter rate limits (requests/tokens per minute); unset means unlimited
+OPENROUTER_RPM = int(os.getenv("OPENROUTER_RPM", "0"))
+OPENROUTER_TPM = int(os.getenv("OPENROUTER_TPM", "0"))
+RECRUITER_MAX_ATTEMPTS = int(os.getenv("RECRUITER_MAX_ATTEMPTS", "5"))
+
+# Resumes are short; skip pages past this limit and near-empty (cover/graphics) pages
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "5"))
+RESUME_MIN_PAGE_CHARS = 20
+
+# Persistent cache of extracted resume text, shared across runs. Entries expire
+# after RECRUITER_CACHE_TTL seconds (default one day); 0 disables the cache.
+RECRUITER_CACHE_DIR = os.path.expanduser(os.getenv("RECRUITER_CACHE_DIR", "~/.recruiter_cache"))
+RECRUITER_CACHE_TTL = int(os.getenv("RECRUITER_CACHE_TTL", "86400"))
+RECRUITER_CACHE_SIZE_LIMIT = 128 * 1024 * 1024
+
+# Batch API screening (OpenAI-compatible /v1/batches endpoint). OpenRouter has
+# no batch endpoint, so the base URL must be set explicitly when batching is on.
+RECRUITER_USE_BATCH = os.getenv("RECRUITER_USE_BATCH", "").lower() in ("1", "true", "yes")
+RECRUITER_BATCH_BASE_URL = os.getenv("RECRUITER_BATCH_BASE_URL")
+RECRUITER_BATCH_POLL_SECONDS = float(os.getenv("RECRUITER_BATCH_POLL_SECONDS", "30"))
+
+
+# --- HTTP Transport ---
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that sends requests through a pooled aiohttp session.
+    
+    The OpenAI-compatible client used by OpenRouter defaults to httpx's own
+    transport, which degrades badly under many concurrent requests. Routing
+    through aiohttp keeps a keep-alive connection pool shared by all agents.
+    """
+    
+    def __init__(self, limit: int = 64, keepalive_timeout: float = 60):
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        # aiohttp sessions are bound to the event loop they were created on,
+        # so keep one per loop (e.g. successive asyncio.run calls)
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._shutdown_guards: Dict[asyncio.AbstractEventLoop, AsyncIterator[None]] = {}
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit,
+                    keepalive_timeout=self._keepalive_timeout
+                ),
+                auto_decompress=False  # httpx handles content decoding
+            )
+            self._sessions[loop] = session
+            # asyncio.run() and asyncio.Runner finalize suspended async generators
+            # before closing their loop, so a parked generator closes the session
+            # on its own loop. The loop only tracks generators weakly; keep a ref.
+            guard = self._close_at_loop_shutdown(loop, session)
+            await anext(guard)
+            self._shutdown_guards[loop] = guard
+        return session
+    
+    async def _close_at_loop_shutdown(self, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession):
+        try:
+            yield
+        finally:
+            if self._sessions.get(loop) is session:
+                del self._sessions[loop]
+                self._shutdown_guards.pop(loop, None)
+            await session.close()
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeout = request.extensions.get("timeout", {})
+        session = await self._get_session()
+        response = await session.request(
+            method=request.method,
+            url=str(request.url),
+            headers=dict(request.headers),
+            data=await request.aread(),
+            allow_redirects=False,
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=timeout.get("connect"),
+                sock_read=timeout.get("read")
+            )
+        )
+        async with response:
+            content = await response.read()
+        return httpx.Response(
+            status_code=response.status,
+            headers=list(response.raw_headers),
+            content=content,
+            request=request
+        )
+    
+    async def aclose(self) -> None:
+        """Close the pooled session for the running loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+    
+    def close(self) -> None:
+        """Close every pooled session whose loop is still usable (also run at exit)."""
+        for loop, session in list(self._sessions.items()):
+            if session.closed or loop.is_closed():
+                continue
+            try:
+                if loop.is_running():
+                    # The loop lives on another thread (e.g. the Streamlit app's background loop)
+                    asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+                else:
+                    loop.run_until_complete(session.close())
+            except Exception as e:
+                logger.debug(f"[HTTP] Failed to close aiohttp session: {e}")
+
+
+# Shared HTTP client for all OpenRouter models
+_http_transport = AiohttpTransport()
+_http_client = httpx.AsyncClient(transport=_http_transport)
+atexit.register(_http_transport.close)
+
+
+def close_http_pool() -> None:
+    """Close the shared HTTP connection pool, e.g. before discarding this module."""
+    _http_transport.close()
+
 
 # --- Pydantic Models ---
 
@@ -71,45 +222,137 @@ class CandidateResult(BaseModel):
 
 # --- PDF Utility Functions ---
 
-def extract_text_from_pdf(file_path: str) -> str:
+_pymupdf_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_resume_text_cache() -> Optional[diskcache.Cache]:
+    """Open the persistent resume text cache on first use, or return None if it is disabled or can't be opened."""
+    if RECRUITER_CACHE_TTL <= 0:
+        return None
+    try:
+        cache = diskcache.Cache(RECRUITER_CACHE_DIR, size_limit=RECRUITER_CACHE_SIZE_LIMIT)
+        # Drop resume text left over from earlier runs that has passed its TTL
+        cache.expire()
+        return cache
+    except Exception as e:
+        logger.warning(f"[CACHE] Resume text cache disabled, cannot open {RECRUITER_CACHE_DIR}: {e}")
+        return None
+
+
+def resume_content_key(file_path: str) -> str:
+    """Return a SHA-256 digest of the file's bytes, read in chunks."""
+    with open(file_path, 'rb') as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _get_cached_text(cache_key: str) -> Optional[str]:
+    """Return persisted resume text, treating cache errors as a miss."""
+    cache = get_resume_text_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"[CACHE] Resume text cache read failed: {e}")
+        return None
+
+
+def _set_cached_text(cache_key: str, text: str) -> None:
+    """Persist resume text; cache errors are logged and otherwise ignored."""
+    cache = get_resume_text_cache()
+    if cache is None:
+        return
+    try:
+        cache.set(cache_key, text, expire=RECRUITER_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"[CACHE] Resume text cache write failed: {e}")
+
+
+def extract_text_from_pdf(file_path: str, content_key: Optional[str] = None) -> str:
     """
     Extract text content from a local PDF file.
     
     Args:
         file_path: Local path to the PDF file
+        content_key: SHA-256 digest of the file, if already computed
         
     Returns:
         Extracted text content
     """
     try:
-        logger.info(f"[PDF] Extracting text from: {file_path}")
+        # Key on content (and extraction settings) so re-uploads with new names still hit
+        if content_key is None:
+            content_key = resume_content_key(file_path)
+        cache_key = f"{content_key}:{RESUME_MAX_PAGES}"
+        cached_text = _get_cached_text(cache_key)
+        if cached_text is not None:
+            logger.info(f"[CACHE] Using persisted resume text for: {file_path}")
+            return cached_text
         
-        # Read local file
-        with open(file_path, 'rb') as f:
-            pdf_content = io.BytesIO(f.read())
+        logger.info(f"[PDF] Extracting text from: {file_path}")
         
-        # Extract text from PDF
-        reader = PdfReader(pdf_content)
-        text = "\n".join(page.extract_text() or "" for page in reader.pages)
+        # Open by path so PyMuPDF can map the file instead of buffering it.
+        # PyMuPDF is not thread-safe, so parsing is serialized across pool workers.
+        parts = []
+        with _pymupdf_lock, pymupdf.open(file_path) as doc:
+            for i, page in enumerate(doc):
+                if i >= RESUME_MAX_PAGES:
+                    break
+                # Plain text extraction only; images and vector graphics are never decoded
+                page_text = page.get_text("text")
+                if len(page_text.strip()) >= RESUME_MIN_PAGE_CHARS:
+                    parts.append(page_text)
+        text = "\n".join(parts)
         logger.info(f"[PDF] Extracted {len(text)} characters")
-        return text
     except Exception as e:
         logger.error(f"[ERROR] Failed to extract PDF from {file_path}: {e}")
         return ""
+    
+    if text:
+        _set_cached_text(cache_key, text)
+    return text
+
+
+# Small shared thread pool that keeps blocking file work off the event loop.
+# Hashing and cache lookups run in parallel; PyMuPDF parsing itself is
+# serialized by _pymupdf_lock, so one PDF is parsed at a time.
+_pdf_executor = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="pdf-extract"
+)
+
+
+async def extract_text_from_pdf_async(file_path: str, content_key: Optional[str] = None) -> str:
+    """Extract PDF text on the shared thread pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pdf_executor, extract_text_from_pdf, file_path, content_key)
+
+
+async def resume_content_key_async(file_path: str) -> Optional[str]:
+    """Hash a resume on the shared thread pool; returns None if the file can't be read."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_pdf_executor, resume_content_key, file_path)
+    except OSError:
+        return None
 
 
 # --- Simulated Tools ---
 
+def generate_interview_slot() -> Tuple[datetime, str]:
+    """Generate a simulated interview slot as a (start time, fake Zoom URL) pair."""
+    # Future time slot 1-7 days from now, starting between 10am and 5pm
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    return (
+        (now + timedelta(days=random.randint(1, 7))).replace(hour=random.randint(10, 17)),
+        f"https://zoom.us/j/{random.randint(100000000, 999999999)}"
+    )
+
+
 def simulate_zoom_scheduling(agent: Agent, candidate_name: str, candidate_email: str) -> str:
     """Simulate Zoom call scheduling."""
-    # Generate a future time slot (1-7 days from now, between 10am-6pm)
-    base_time = datetime.now() + timedelta(days=random.randint(1, 7))
-    hour = random.randint(10, 17)  # 10am to 5pm
-    scheduled_time = base_time.replace(hour=hour, minute=0, second=0, microsecond=0)
-
-    # Generate fake Zoom URL
-    meeting_id = random.randint(100000000, 999999999)
-    zoom_url = f"https://zoom.us/j/{meeting_id}"
+    scheduled_time, zoom_url = generate_interview_slot()
 
     result = "[OK] Zoom call scheduled successfully!\n"
     result += f"Time: {scheduled_time.strftime('%Y-%m-%d %H:%M')} IST\n"
@@ -120,7 +363,7 @@ def simulate_zoom_scheduling(agent: Agent, candidate_name: str, candidate_email:
     return result
 
 
-def simulate_email_sending(agent: Agent, to_email: str, subject: str, body: str) -> str:
+def simulate_email_sending(agent: Optional[Agent], to_email: str, subject: str, body: str) -> str:
     """Simulate email sending."""
     result = "[OK] Email sent successfully!\n"
     result += f"To: {to_email}\n"
@@ -134,17 +377,12 @@ def simulate_email_sending(agent: Agent, to_email: str, subject: str, body: str)
 
 # --- Agents ---
 
-screening_agent = Agent(
-    name="Screening Agent",
-    model=OpenRouter(
-        id=os.getenv("OPENROUTER_MODEL_ID", "minimax/minimax-m2:free"),
-        api_key=os.getenv("OPENROUTER_API_KEY")
-    ),
-    description=dedent("""\
+_SCREENING_DESCRIPTION = dedent("""\
     You are an expert HR specialist who screens candidates for job positions.
     You analyze resumes against job requirements and provide detailed assessments.
-    """),
-    instructions=dedent("""\
+    """)
+
+_SCREENING_INSTRUCTIONS = dedent("""\
     Screen candidates based on their resume and job description:
     
     1. Analysis Points:
@@ -172,27 +410,17 @@ screening_agent = Agent(
        - If not found, use placeholder values
     
     Always be thorough, fair, and professional in your assessment.
-    """),
-    output_schema=ScreeningResult,
-    markdown=True,
-    debug_mode=True,
-)
+    """)
 
-scheduler_agent = Agent(
-    name="Scheduler Agent",
-    model=OpenRouter(
-        id=os.getenv("OPENROUTER_MODEL_ID", "minimax/minimax-m2:free"),
-        api_key=os.getenv("OPENROUTER_API_KEY")
-    ),
-    description=dedent("""\
+_SCHED_DESCRIPTION = dedent("""\
     You are an interview scheduling specialist who coordinates meeting times
     and creates calendar invites for candidate interviews.
-    """),
-    instructions=dedent(f"""\
+    """)
+
+# Static scheduler instructions; the current time is supplied per request
+_SCHED_INSTRUCTIONS = dedent("""\
     Schedule interview calls for candidates:
     
-    Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} IST
-    
     1. Scheduling Guidelines:
        - Schedule between 10am-6pm IST on weekdays
        - Use the simulate_zoom_scheduling tool
@@ -207,24 +435,14 @@ scheduler_agent = Agent(
     
     3. Output:
        Return structured data with name, email, call_time, and url.
-    """),
-    tools=[simulate_zoom_scheduling],
-    output_schema=ScheduledCall,
-    markdown=True,
-    debug_mode=True,
-)
+    """)
 
-email_writer_agent = Agent(
-    name="Email Writer Agent",
-    model=OpenRouter(
-        id=os.getenv("OPENROUTER_MODEL_ID", "minimax/minimax-m2:free"),
-        api_key=os.getenv("OPENROUTER_API_KEY")
-    ),
-    description=dedent("""\
+_EMAIL_WRITER_DESCRIPTION = dedent("""\
     You are a professional email writer who creates warm, engaging
     interview invitation emails for candidates.
-    """),
-    instructions=dedent("""\
+    """)
+
+_EMAIL_WRITER_INSTRUCTIONS = dedent("""\
     Write professional interview invitation emails:
     
     1. Structure:
@@ -252,23 +470,14 @@ email_writer_agent = Agent(
        Email: john@agno.com
     
     Keep emails concise (200-300 words) but warm and welcoming.
-    """),
-    output_schema=EmailContent,
-    markdown=True,
-    debug_mode=True,
-)
+    """)
 
-email_sender_agent = Agent(
-    name="Email Sender Agent",
-    model=OpenRouter(
-        id=os.getenv("OPENROUTER_MODEL_ID", "minimax/minimax-m2:free"),
-        api_key=os.getenv("OPENROUTER_API_KEY")
-    ),
-    description=dedent("""\
+_EMAIL_SENDER_DESCRIPTION = dedent("""\
     You are an email delivery specialist who sends emails using
     the email sending tool and confirms successful delivery.
-    """),
-    instructions=dedent("""\
+    """)
+
+_EMAIL_SENDER_INSTRUCTIONS = dedent("""\
     Send emails using the simulate_email_sending tool:
     
     1. Use the tool with exact parameters provided
@@ -276,33 +485,155 @@ email_sender_agent = Agent(
     3. Report any issues
     
     Always confirm the email was sent with details.
-    """),
-    tools=[simulate_email_sending],
-    markdown=True,
-    debug_mode=True,
-)
+    """)
 
 
-# --- Main Recruitment Functions ---
+# Agents and their model are built on first use so importing this module stays cheap
 
-async def screen_candidate(resume_path: str, job_description: str, resume_cache: dict) -> Optional[ScreeningResult]:
-    """Screen a single candidate from their resume file."""
-    logger.info(f"[SCREEN] Processing candidate from: {Path(resume_path).name}")
+@functools.lru_cache(maxsize=None)
+def get_model() -> OpenRouter:
+    """Return the OpenRouter model shared by all agents (one client and connection pool)."""
+    return OpenRouter(
+        id=OPENROUTER_MODEL_ID,
+        api_key=OPENROUTER_API_KEY,
+        http_client=_http_client,
+        # call_with_retry owns retries; SDK retries would multiply its attempts
+        max_retries=0
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_screening_agent() -> Agent:
+    """Return the agent that screens resumes against the job description."""
+    return Agent(
+        name="Screening Agent",
+        model=get_model(),
+        description=_SCREENING_DESCRIPTION,
+        instructions=_SCREENING_INSTRUCTIONS,
+        output_schema=ScreeningResult,
+        markdown=False,
+        debug_mode=RECRUITER_DEBUG,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_scheduler_agent() -> Agent:
+    """Return the agent that schedules interview calls."""
+    return Agent(
+        name="Scheduler Agent",
+        model=get_model(),
+        description=_SCHED_DESCRIPTION,
+        instructions=_SCHED_INSTRUCTIONS,
+        tools=[simulate_zoom_scheduling],
+        output_schema=ScheduledCall,
+        markdown=False,
+        debug_mode=RECRUITER_DEBUG,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_writer_agent() -> Agent:
+    """Return the agent that writes interview invitation emails."""
+    return Agent(
+        name="Email Writer Agent",
+        model=get_model(),
+        description=_EMAIL_WRITER_DESCRIPTION,
+        instructions=_EMAIL_WRITER_INSTRUCTIONS,
+        output_schema=EmailContent,
+        markdown=False,
+        debug_mode=RECRUITER_DEBUG,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_email_sender_agent() -> Agent:
+    """Return the agent that sends emails via the simulated tool."""
+    return Agent(
+        name="Email Sender Agent",
+        model=get_model(),
+        description=_EMAIL_SENDER_DESCRIPTION,
+        instructions=_EMAIL_SENDER_INSTRUCTIONS,
+        tools=[simulate_email_sending],
+        markdown=False,
+        debug_mode=RECRUITER_DEBUG,
+    )
+
+
+# --- Rate Limiting & Retries ---
+
+_request_limiter = AsyncLimiter(OPENROUTER_RPM, 60) if OPENROUTER_RPM > 0 else None
+_token_limiter = AsyncLimiter(OPENROUTER_TPM, 60) if OPENROUTER_TPM > 0 else None
+
+
+def _is_retryable(error: ModelProviderError) -> bool:
+    """Rate limits and server-side failures are worth retrying."""
+    return error.status_code == 429 or error.status_code >= 500
+
+
+async def call_with_retry(agent: Agent, prompt: str, *, max_attempts: int = RECRUITER_MAX_ATTEMPTS) -> Any:
+    """
+    Run an agent under the configured rate limits, backing off on 429/5xx errors.
     
-    # Extract resume text (with caching)
-    if resume_path not in resume_cache:
-        resume_text = extract_text_from_pdf(resume_path)
-        if not resume_text:
-            logger.error(f"[ERROR] Could not extract text from resume: {resume_path}")
-            return None
-        resume_cache[resume_path] = resume_text
-    else:
-        logger.info("[CACHE] Using cached resume content")
+    Errored runs are retried too, and the last error is raised instead of returned.
     
-    resume_text = resume_cache[resume_path]
+    Args:
+        agent: Agent to run
+        prompt: Prompt to send
+        max_attempts: Total attempts before the last error is re-raised
+        
+    Returns:
+        The agent's run response
+    """
+    # Rough prompt size estimate (~4 characters per token), capped at the limiter capacity
+    estimated_tokens = max(1, len(prompt) // 4)
     
-    # Screen the candidate
-    screening_prompt = f"""
+    for attempt in range(1, max_attempts + 1):
+        if _request_limiter is not None:
+            await _request_limiter.acquire()
+        if _token_limiter is not None:
+            await _token_limiter.acquire(min(estimated_tokens, OPENROUTER_TPM))
+        
+        try:
+            response = await agent.arun(prompt)
+            # Newer agno releases catch provider errors inside arun and return an
+            # errored run instead of raising. The status code is lost, so raise it
+            # as a generic (retryable) provider error rather than hand the error
+            # text to callers as model output.
+            if getattr(response, "status", None) == RunStatus.error:
+                raise ModelProviderError(str(response.content), model_id=OPENROUTER_MODEL_ID)
+            return response
+        except ModelProviderError as e:
+            if attempt == max_attempts or not _is_retryable(e):
+                raise
+            delay = min(60, 2 ** attempt + random.random())
+            logger.warning(
+                f"[RETRY] {agent.name} failed with status {e.status_code}: {e} "
+                f"(attempt {attempt}/{max_attempts}), retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+
+# --- Main Recruitment Functions ---
+
+# Patterns used when parsing free-text (non-structured) agent responses
+_NAME_RE = re.compile(r'^.*?name:(.*)$', re.IGNORECASE | re.MULTILINE)
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_SCORE_RES = [
+    re.compile(r'score[:\s]+(\d+\.?\d*)', re.IGNORECASE),
+    re.compile(r'(\d+\.?\d*)/10'),
+    re.compile(r'rating[:\s]+(\d+\.?\d*)', re.IGNORECASE)
+]
+_SUBJECT_RE = re.compile(r'subject[:\s]+(.*?)[\n\r]', re.IGNORECASE)
+
+
+def normalize_score(score: float) -> float:
+    """Map a parsed score onto the 0-10 scale (e.g. 75 out of 100 -> 7.5)."""
+    return score / 10 if score > 10 else score
+
+
+def build_screening_prompt(resume_text: str, job_description: str) -> str:
+    """Build the screening prompt for a single resume."""
+    return f"""
     Please screen this candidate for the job position.
 
     RESUME:
@@ -313,9 +644,128 @@ async def screen_candidate(resume_path: str, job_description: str, resume_cache:
 
     Evaluate how well this candidate matches the job requirements and provide a score from 0-10.
     """
+
+
+async def screen_candidates_batch(
+    resume_paths: List[str],
+    job_description: str,
+    resume_cache: dict
+) -> dict:
+    """
+    Screen candidates in a single Batch API job instead of one live call each.
+    
+    Args:
+        resume_paths: Resume file paths; only those with extracted text in resume_cache are submitted
+        job_description: Job description to screen against
+        resume_cache: Mapping of resume path to extracted text
+        
+    Returns:
+        Dict mapping resume path to ScreeningResult (None or absent if that request failed)
+    """
+    system_prompt = f"{_SCREENING_DESCRIPTION}\n{_SCREENING_INSTRUCTIONS}"
+    
+    # One JSONL line per unique resume, keyed by path (orjson serializes large
+    # resume payloads straight to bytes, faster than stdlib json)
+    lines = []
+    for resume_path in dict.fromkeys(resume_paths):
+        if not resume_cache.get(resume_path):
+            continue
+        lines.append(orjson.dumps({
+            "custom_id": resume_path,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": OPENROUTER_MODEL_ID,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": build_screening_prompt(resume_cache[resume_path], job_description)}
+                ],
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "ScreeningResult",
+                        "schema": ScreeningResult.model_json_schema()
+                    }
+                }
+            }
+        }))
+    
+    if not lines:
+        logger.info("[BATCH] No resumes with extracted text, nothing to submit")
+        return {}
+    
+    client = AsyncOpenAI(
+        api_key=OPENROUTER_API_KEY,
+        base_url=RECRUITER_BATCH_BASE_URL,
+        http_client=_http_client
+    )
+    logger.info(f"[BATCH] Submitting {len(lines)} screening requests")
+    input_file = await client.files.create(
+        file=("batch_input.jsonl", b"\n".join(lines)),
+        purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        logger.info(f"[BATCH] Batch {batch.id} status: {batch.status}")
+        await asyncio.sleep(RECRUITER_BATCH_POLL_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+    
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+    
+    output = await client.files.content(batch.output_file_id)
+    
+    results = {}
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        resume_path = record["custom_id"]
+        try:
+            content = record["response"]["body"]["choices"][0]["message"]["content"]
+            result = ScreeningResult.model_validate_json(content)
+            logger.info(f"[SCREEN] {result.name} scored {result.score}/10 (batch)")
+            results[resume_path] = result
+        except Exception as e:
+            logger.error(f"[ERROR] Batch screening failed for {resume_path}: {e}")
+            results[resume_path] = None
+    
+    # Requests the batch rejected outright are listed in a separate error file
+    if batch.error_file_id:
+        errors = await client.files.content(batch.error_file_id)
+        for line in errors.content.splitlines():
+            if line.strip():
+                record = orjson.loads(line)
+                logger.warning(f"[BATCH] Request failed for {record.get('custom_id')}: {record.get('error') or record.get('response')}")
+    
+    return results
+
+
+async def screen_candidate(resume_path: str, job_description: str, resume_cache: dict) -> Optional[ScreeningResult]:
+    """Screen a single candidate from their resume file."""
+    logger.info(f"[SCREEN] Processing candidate from: {Path(resume_path).name}")
+    
+    # Extract resume text (with caching)
+    if resume_path in resume_cache:
+        logger.info("[CACHE] Using cached resume content")
+    else:
+        resume_cache[resume_path] = await extract_text_from_pdf_async(resume_path)
+    
+    resume_text = resume_cache[resume_path]
+    if not resume_text:
+        logger.error(f"[ERROR] Could not extract text from resume: {resume_path}")
+        return None
+    
+    # Screen the candidate
+    screening_prompt = build_screening_prompt(resume_text, job_description)
     
     try:
-        response = await screening_agent.arun(screening_prompt)
+        response = await call_with_retry(get_screening_agent(), screening_prompt)
         
         if not response or not response.content:
             logger.error("[ERROR] Failed to screen candidate")
@@ -329,35 +779,24 @@ async def screen_candidate(resume_path: str, job_description: str, resume_cache:
             # Fallback: Try to parse text response manually
             logger.warning("[WARNING] Screening result not in expected format, attempting fallback parsing")
             text_content = str(response.content)
-            logger.debug(f"[DEBUG] Raw response content: {text_content[:500]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[DEBUG] Raw response content: {text_content[:500]}...")
             
             # Extract name (look for common patterns)
-            name = "Unknown Candidate"
-            if "name:" in text_content.lower():
-                lines = text_content.split('\n')
-                for line in lines:
-                    if "name:" in line.lower():
-                        name = line.split(':', 1)[1].strip()
-                        break
+            name_match = _NAME_RE.search(text_content)
+            name = name_match.group(1).strip() if name_match else "Unknown Candidate"
             
             # Extract email
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text_content)
+            email_match = _EMAIL_RE.search(text_content)
             email = email_match.group(0) if email_match else f"{name.replace(' ', '.').lower()}@example.com"
             
             # Extract score (look for X/10 or score: X patterns)
             score = 5.0  # default
-            score_patterns = [
-                r'score[:\s]+(\d+\.?\d*)',
-                r'(\d+\.?\d*)/10',
-                r'rating[:\s]+(\d+\.?\d*)'
-            ]
-            for pattern in score_patterns:
-                score_match = re.search(pattern, text_content.lower())
+            for score_re in _SCORE_RES:
+                score_match = score_re.search(text_content)
                 if score_match:
                     try:
-                        score = float(score_match.group(1))
-                        if score > 10:  # normalize if needed
-                            score = score / 10
+                        score = normalize_score(float(score_match.group(1)))
                         break
                     except:
                         pass
@@ -386,6 +825,8 @@ async def schedule_interview(candidate: ScreeningResult) -> Optional[ScheduledCa
     logger.info(f"[SCHEDULE] Scheduling interview for {candidate.name}")
     
     schedule_prompt = f"""
+    Current time: {datetime.now():%Y-%m-%d %H:%M:%S} IST
+    
     Schedule a 1-hour interview call for:
     - Candidate: {candidate.name}
     - Email: {candidate.email}
@@ -395,7 +836,7 @@ async def schedule_interview(candidate: ScreeningResult) -> Optional[ScheduledCa
     """
     
     try:
-        response = await scheduler_agent.arun(schedule_prompt)
+        response = await call_with_retry(get_scheduler_agent(), schedule_prompt)
         
         if not response or not response.content:
             logger.error("[ERROR] Failed to schedule interview")
@@ -409,12 +850,8 @@ async def schedule_interview(candidate: ScreeningResult) -> Optional[ScheduledCa
             # Fallback: Parse text response or use simulated scheduling directly
             logger.warning("[WARNING] Scheduling result not in expected format, using fallback")
             
-            # Generate a simulated schedule
-            base_time = datetime.now() + timedelta(days=random.randint(1, 7))
-            hour = random.randint(10, 17)
-            scheduled_time = base_time.replace(hour=hour, minute=0, second=0, microsecond=0)
-            meeting_id = random.randint(100000000, 999999999)
-            zoom_url = f"https://zoom.us/j/{meeting_id}"
+            # Use a simulated schedule
+            scheduled_time, zoom_url = generate_interview_slot()
             
             result = ScheduledCall(
                 name=candidate.name,
@@ -445,7 +882,7 @@ async def send_interview_invitation(candidate: ScreeningResult, scheduled_call:
     """
     
     try:
-        response = await email_writer_agent.arun(email_prompt)
+        response = await call_with_retry(get_email_writer_agent(), email_prompt)
         
         if not response or not response.content:
             logger.error("[ERROR] Failed to generate email")
@@ -456,16 +893,19 @@ async def send_interview_invitation(candidate: ScreeningResult, scheduled_call:
             logger.info(f"[EMAIL] Generated email: {email_content.subject}")
             
             # Send the email
-            send_prompt = f"""
-            Send the interview invitation email:
-            - To: {candidate.email}
-            - Subject: {email_content.subject}
-            - Body: {email_content.body}
-            
-            Use the simulate_email_sending tool.
-            """
-            
-            send_response = await email_sender_agent.arun(send_prompt)
+            if RECRUITER_USE_EMAIL_AGENT:
+                send_prompt = f"""
+                Send the interview invitation email:
+                - To: {candidate.email}
+                - Subject: {email_content.subject}
+                - Body: {email_content.body}
+                
+                Use the simulate_email_sending tool.
+                """
+                send_response = await call_with_retry(get_email_sender_agent(), send_prompt)
+            else:
+                # The send parameters are already known, so call the tool directly
+                send_response = simulate_email_sending(None, candidate.email, email_content.subject, email_content.body)
             
             if send_response:
                 logger.info(f"[EMAIL] Successfully sent to {candidate.email}")
@@ -481,7 +921,7 @@ async def send_interview_invitation(candidate: ScreeningResult, scheduled_call:
             subject = f"Interview Invitation - Backend Engineer Position"
             
             # Try to extract subject if mentioned
-            subject_match = re.search(r'subject[:\s]+(.*?)[\n\r]', text_content, re.IGNORECASE)
+            subject_match = _SUBJECT_RE.search(text_content)
             if subject_match:
                 subject = subject_match.group(1).strip()
             
@@ -519,11 +959,15 @@ john@agno.com"""
 async def process_candidates(
     candidate_resume_paths: List[str],
     job_description: str,
-    min_score: float = 5.0
+    min_score: float = 5.0,
+    on_result: Optional[Callable[[CandidateResult], None]] = None
 ) -> dict:
     """
     Process all candidates through the complete recruitment workflow.
     
+    If on_result is given, it is called with each CandidateResult as soon as
+    that candidate is finished (rejected, or scheduled and emailed).
+    
     Returns a dictionary with:
     - all_candidates: List of all screened candidates
     - selected_candidates: List of candidates who passed screening
@@ -550,6 +994,16 @@ async def process_candidates(
             "error": "No job description provided"
         }
     
+    if RECRUITER_USE_BATCH and not RECRUITER_BATCH_BASE_URL:
+        logger.error("[ERROR] RECRUITER_USE_BATCH is set but RECRUITER_BATCH_BASE_URL is not")
+        return {
+            "all_candidates": [],
+            "selected_candidates": [],
+            "results": [],
+            "email_contents": {},
+            "error": "RECRUITER_USE_BATCH requires RECRUITER_BATCH_BASE_URL (an OpenAI-compatible endpoint with /v1/batches)"
+        }
+    
     logger.info(f"[PIPELINE] Starting recruitment process for {len(candidate_resume_paths)} candidates")
     logger.info("=" * 60)
     
@@ -559,71 +1013,176 @@ async def process_candidates(
     results = []
     email_contents = {}  # Store email contents for UI display
     
-    # Phase 1: Candidate Screening
-    logger.info("[PHASE 1] CANDIDATE SCREENING")
+    # Group byte-identical resumes so each distinct file is extracted and screened once
+    content_keys = await asyncio.gather(*[resume_content_key_async(p) for p in candidate_resume_paths])
+    key_by_path = dict(zip(candidate_resume_paths, content_keys))
+    hash_to_paths = defaultdict(list)
+    for file_path, content_key in zip(candidate_resume_paths, content_keys):
+        # Unreadable files can't be compared, so each stays in its own group
+        hash_to_paths[content_key or file_path].append(file_path)
+    path_groups = list(hash_to_paths.values())
+    unique_paths = [paths[0] for paths in path_groups]
+    if len(unique_paths) < len(candidate_resume_paths):
+        logger.info(f"[DEDUP] {len(candidate_resume_paths) - len(unique_paths)} duplicate resume(s) will reuse screening results")
+    
+    # Extract all resumes up front on the PDF pool so parsing runs off the event loop
+    resume_texts = await asyncio.gather(*[
+        # Pass the digests along so extraction doesn't hash each file again
+        extract_text_from_pdf_async(p, key_by_path[p]) for p in unique_paths
+    ])
+    resume_cache.update(zip(unique_paths, resume_texts))
+    
+    # Screening (producers) and interview scheduling (consumers) are pipelined: a
+    # selected candidate is scheduled as soon as their own screening finishes.
+    logger.info("[PIPELINE] SCREENING & INTERVIEW SCHEDULING")
     logger.info("-" * 60)
     
-    for i, file_path in enumerate(candidate_resume_paths, 1):
-        logger.info(f"[CANDIDATE {i}/{len(candidate_resume_paths)}] Processing...")
+    semaphore = asyncio.Semaphore(RECRUITER_CONCURRENCY)
+    interview_queue = asyncio.Queue()
+    
+    # Per-resume slots keep the final report in submission order
+    screened: List[Optional[ScreeningResult]] = [None] * len(unique_paths)
+    candidate_results: List[List[CandidateResult]] = [[] for _ in unique_paths]
+    
+    def emit(index: int) -> None:
+        """Report a finished resume's results to the caller's callback."""
+        if not on_result:
+            return
+        for result in candidate_results[index]:
+            try:
+                on_result(result)
+            except Exception as e:
+                logger.warning(f"[PIPELINE] on_result callback failed for {result.name}: {e}")
+    
+    def record_screening(index: int, screening_result: Optional[ScreeningResult]) -> None:
+        """Store a screening outcome and queue the candidate for an interview if selected."""
+        if not screening_result:
+            logger.error(f"[ERROR] Failed to process candidate from {unique_paths[index]}")
+            return
         
-        screening_result = await screen_candidate(file_path, job_description, resume_cache)
+        screened[index] = screening_result
+        is_selected = screening_result.score >= min_score
+        if is_selected:
+            logger.info(f"[SELECTED] {screening_result.name} - Score: {screening_result.score}/10")
+        else:
+            logger.info(f"[REJECTED] {screening_result.name} - Score: {screening_result.score}/10 (below {min_score})")
         
-        if screening_result:
-            all_candidates.append(screening_result)
-            
-            candidate_result = CandidateResult(
+        # Fan the screening result out to every submission of this resume
+        candidate_results[index] = [
+            CandidateResult(
                 name=screening_result.name,
                 email=screening_result.email,
                 score=screening_result.score,
                 feedback=screening_result.feedback,
-                status="rejected" if screening_result.score < min_score else "selected"
+                status="selected" if is_selected else "rejected"
             )
-            
-            if screening_result.score >= min_score:
-                selected_candidates.append(screening_result)
-                logger.info(f"[SELECTED] {screening_result.name} - Score: {screening_result.score}/10")
-            else:
-                logger.info(f"[REJECTED] {screening_result.name} - Score: {screening_result.score}/10 (below {min_score})")
-            
-            results.append(candidate_result)
+            for _ in path_groups[index]
+        ]
+        
+        if is_selected:
+            interview_queue.put_nowait(index)
         else:
-            logger.error(f"[ERROR] Failed to process candidate from {file_path}")
+            emit(index)
     
-    # Phase 2: Interview Scheduling & Email Communication
-    if selected_candidates:
-        logger.info(f"\n[PHASE 2] INTERVIEW SCHEDULING ({len(selected_candidates)} candidates)")
-        logger.info("-" * 60)
-        
-        for i, candidate in enumerate(selected_candidates, 1):
-            logger.info(f"[INTERVIEW {i}/{len(selected_candidates)}] Processing {candidate.name}...")
+    async def screen_and_enqueue(index: int) -> None:
+        file_path = unique_paths[index]
+        async with semaphore:
+            logger.info(f"[CANDIDATE {index + 1}/{len(unique_paths)}] Processing...")
+            try:
+                screening_result = await screen_candidate(file_path, job_description, resume_cache)
+            except Exception as e:
+                logger.error(f"[ERROR] Screening raised for {file_path}: {e}")
+                screening_result = None
+        record_screening(index, screening_result)
+    
+    async def process_selected(index: int) -> None:
+        candidate = screened[index]
+        async with semaphore:
+            logger.info(f"[INTERVIEW] Processing {candidate.name}...")
             
             # Schedule interview
             scheduled_call = await schedule_interview(candidate)
+            if not scheduled_call:
+                logger.error(f"[ERROR] Failed to schedule interview for {candidate.name}")
+                return
             
-            if scheduled_call:
-                # Send invitation email
-                email_content = await send_interview_invitation(candidate, scheduled_call)
-                
-                # Update results and store email content
-                for result in results:
-                    if result.email == candidate.email:
-                        result.interview_time = scheduled_call.call_time
-                        result.meeting_url = scheduled_call.url
-                        if email_content:
-                            result.email_subject = email_content.subject
-                            result.status = "email_sent"
-                            # Store email content for UI
-                            email_contents[candidate.email] = {
-                                "subject": email_content.subject,
-                                "body": email_content.body
-                            }
-                        else:
-                            result.status = "scheduled"
-                        break
+            # Send invitation email
+            email_content = await send_interview_invitation(candidate, scheduled_call)
+        
+        # Update results and store email content
+        for result in candidate_results[index]:
+            result.interview_time = scheduled_call.call_time
+            result.meeting_url = scheduled_call.url
+            if email_content:
+                result.email_subject = email_content.subject
+                result.status = "email_sent"
             else:
-                logger.error(f"[ERROR] Failed to schedule interview for {candidate.name}")
-    else:
-        logger.info("\n[PHASE 2] No candidates selected for interviews")
+                result.status = "scheduled"
+        
+        # Store email content for UI
+        if email_content:
+            email_contents[candidate.email] = {
+                "subject": email_content.subject,
+                "body": email_content.body
+            }
+    
+    async def interview_worker() -> None:
+        while True:
+            index = await interview_queue.get()
+            try:
+                try:
+                    await process_selected(index)
+                except Exception as e:
+                    logger.error(f"[ERROR] Interview processing raised for {screened[index].name}: {e}")
+                emit(index)
+            finally:
+                interview_queue.task_done()
+    
+    # Task groups tie every producer and worker to this call: if any of them dies,
+    # the rest are cancelled instead of being left on the loop or hanging join()
+    async with asyncio.TaskGroup() as pipeline:
+        workers = [pipeline.create_task(interview_worker()) for _ in range(RECRUITER_CONCURRENCY)]
+        
+        # Anything the batch doesn't screen (failed requests, or the whole batch)
+        # goes through live screening instead of being dropped
+        pending = list(range(len(unique_paths)))
+        if RECRUITER_USE_BATCH:
+            try:
+                batch_results = await screen_candidates_batch(unique_paths, job_description, resume_cache)
+            except Exception as e:
+                logger.warning(f"[BATCH] Batch screening failed, falling back to live screening: {e}")
+            else:
+                pending = []
+                for index, file_path in enumerate(unique_paths):
+                    if batch_results.get(file_path):
+                        record_screening(index, batch_results[file_path])
+                    else:
+                        pending.append(index)
+                if pending:
+                    logger.info(f"[BATCH] {len(pending)} resume(s) missing from batch output, screening them live")
+        
+        async with asyncio.TaskGroup() as screening:
+            for index in pending:
+                screening.create_task(screen_and_enqueue(index))
+        
+        # All producers are done; wait for queued interviews to drain
+        await interview_queue.join()
+        for worker in workers:
+            worker.cancel()
+    
+    # Assemble the report in submission order, counting every upload of a
+    # duplicated resume so the lists stay the same length as results
+    for index, screening_result in enumerate(screened):
+        if screening_result is None:
+            continue
+        copies = [screening_result] * len(path_groups[index])
+        all_candidates.extend(copies)
+        if screening_result.score >= min_score:
+            selected_candidates.extend(copies)
+        results.extend(candidate_results[index])
+    
+    if not selected_candidates:
+        logger.info("[PIPELINE] No candidates selected for interviews")
     
     logger.info("=" * 60)
     logger.info(f"[COMPLETE] Processed {len(all_candidates)} candidates, {len(selected_candidates)} selected")
@@ -635,3 +1194,30 @@ async def process_candidates(
         "email_contents": email_contents
     }
 
+
+async def process_candidates_stream(
+    candidate_resume_paths: List[str],
+    job_description: str,
+    min_score: float = 5.0
+) -> AsyncIterator[CandidateResult]:
+    """
+    Yield each candidate's CandidateResult as soon as it is finished.
+    
+    Results arrive in completion order, not submission order. Closing the
+    generator early cancels the remaining work.
+    """
+    finished: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(process_candidates(
+        candidate_resume_paths,
+        job_description,
+        min_score,
+        on_result=finished.put_nowait
+    ))
+    # Sentinel queued after the last result, however the pipeline ends
+    task.add_done_callback(lambda _: finished.put_nowait(None))
+    try:
+        while (result := await finished.get()) is not None:
+            yield result
+        await task
+    finally:
+        task.cancel()
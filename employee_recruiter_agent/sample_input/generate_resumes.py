@@ -5,274 +5,310 @@ Generate sample PDF resumes for testing the Employee Recruiter Agent
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
+import os
+import sys
 
+OUTPUT_DIR = Path(__file__).parent
 
-def create_john_smith_resume():
-    """Create resume for John Smith - Backend Engineer (Should score ~7.5/10)"""
-    
-    output_dir = Path(__file__).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filename = output_dir / "john_smith_resume.pdf"
-    
-    doc = SimpleDocTemplate(str(filename), pagesize=letter,
-                            rightMargin=72, leftMargin=72,
-                            topMargin=72, bottomMargin=18)
+# Shared styles and flowables, built once and reused by every resume.
+# ParagraphStyle copies its parent's attributes when constructed, so the
+# parent= chains below cost nothing during layout.
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#2C3E50'),
+    spaceAfter=6,
+    alignment=TA_CENTER
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#2C3E50'),
+    spaceAfter=6,
+    spaceBefore=12
+)
+
+# Bulleted items with a hanging indent so wrapped lines align with the text
+_BULLET_STYLE = ParagraphStyle(
+    'CustomBullet',
+    parent=_STYLES['Normal'],
+    leftIndent=10,
+    bulletIndent=0
+)
+
+_SKILLS_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+])
+
+# Spacers are stateless, so the same instances can appear in every story
+_SMALL_SPACER = Spacer(1, 0.1*inch)
+_LARGE_SPACER = Spacer(1, 0.2*inch)
+
+
+# --- Resume Specs ---
+# Each resume is a header plus a list of sections; each section is a heading
+# followed by blocks of ("paragraph", text), ("bullets", items), ("table", rows)
+# or ("spacer", size).
+
+RESUMES = [
+    {
+        # Backend Engineer (Should score ~7.5/10)
+        "filename": "john_smith_resume.pdf",
+        "name": "John Smith",
+        "title": "Backend Engineer",
+        "contact": [
+            "Email: john.smith@example.com | Phone: +1 (555) 123-4567",
+            "GitHub: github.com/johnsmith | LinkedIn: linkedin.com/in/johnsmith",
+        ],
+        "sections": [
+            ("Professional Summary", [
+                ("paragraph",
+                 "Experienced Backend Engineer with 5+ years building scalable microservices and "
+                 "distributed systems. Proven expertise in Python, TypeScript, AWS, and Docker. "
+                 "Passionate about open-source contributions and infrastructure as code. "
+                 "Strong track record of delivering high-performance backend solutions in fast-paced environments."),
+                ("spacer", "small"),
+            ]),
+            ("Technical Skills", [
+                ("table", [
+                    ["Languages:", "Python, TypeScript, JavaScript, Go"],
+                    ["Cloud & DevOps:", "AWS (EC2, Lambda, S3, RDS, CloudFormation), Docker, Kubernetes"],
+                    ["Infrastructure:", "Terraform, Ansible, CI/CD (GitHub Actions, Jenkins)"],
+                    ["Databases:", "PostgreSQL, MongoDB, Redis, DynamoDB"],
+                    ["Frameworks:", "FastAPI, Django, Express.js, Node.js"],
+                    ["Other:", "Microservices, RESTful APIs, GraphQL, Message Queues (RabbitMQ, SQS)"]
+                ]),
+                ("spacer", "small"),
+            ]),
+            ("Work Experience", [
+                ("paragraph", "<b>Senior Backend Engineer</b> | TechCorp Inc. | 2021 - Present"),
+                ("bullets", [
+                    "Architected and deployed Python microservices handling 10M+ daily requests using FastAPI and AWS Lambda",
+                    "Reduced infrastructure costs by 40% through optimization of AWS resources and containerization with Docker",
+                    "Implemented Infrastructure as Code using Terraform, managing 50+ AWS resources across multiple environments",
+                    "Led migration from monolith to microservices architecture, improving deployment frequency by 300%",
+                    "Mentored junior developers and contributed to open-source projects (3 major PRs accepted)",
+                ]),
+                ("spacer", "small"),
+                ("paragraph", "<b>Backend Developer</b> | DataFlow Systems | 2019 - 2021"),
+                ("bullets", [
+                    "Developed RESTful APIs using Django and PostgreSQL serving 1M+ users",
+                    "Implemented real-time data processing pipelines using AWS Kinesis and Lambda",
+                    "Set up CI/CD pipelines with GitHub Actions, reducing deployment time by 60%",
+                    "Integrated third-party services and managed Docker containerization",
+                    "Collaborated with frontend team using TypeScript and Node.js for BFF layer",
+                ]),
+                ("spacer", "small"),
+            ]),
+            ("Education", [
+                ("paragraph",
+                 "<b>Bachelor of Science in Computer Science</b><br/>"
+                 "University of California, Berkeley | 2015 - 2019<br/>"
+                 "GPA: 3.7/4.0"),
+                ("spacer", "small"),
+            ]),
+            ("Open Source & Community", [
+                ("bullets", [
+                    "Active contributor to popular Python packages (FastAPI, SQLAlchemy)",
+                    "Maintainer of docker-compose-automation tool (500+ GitHub stars)",
+                    "Speaker at PyCon 2023: 'Building Scalable Microservices with Python'",
+                    "Regular contributor to AWS CDK documentation",
+                ]),
+            ]),
+        ],
+    },
+    {
+        # Frontend Developer (Should score ~3.5/10)
+        "filename": "sarah_johnson_resume.pdf",
+        "name": "Sarah Johnson",
+        "title": "Frontend Developer",
+        "contact": [
+            "Email: sarah.j@example.com | Phone: +1 (555) 987-6543",
+            "Portfolio: sarahjohnson.dev | LinkedIn: linkedin.com/in/sarahjohnson",
+        ],
+        "sections": [
+            ("Professional Summary", [
+                ("paragraph",
+                 "Creative Frontend Developer with 4 years of experience building beautiful, responsive "
+                 "user interfaces. Expert in React, JavaScript, and modern CSS. Passionate about UX/UI "
+                 "design and creating intuitive user experiences. Strong collaboration skills and "
+                 "experience working with design teams."),
+                ("spacer", "small"),
+            ]),
+            ("Technical Skills", [
+                ("table", [
+                    ["Languages:", "JavaScript, TypeScript, HTML5, CSS3"],
+                    ["Frameworks:", "React, Next.js, Vue.js, Redux, React Query"],
+                    ["Styling:", "Tailwind CSS, Material-UI, Styled Components, SASS"],
+                    ["Tools:", "Git, Webpack, Vite, npm, Figma"],
+                    ["Testing:", "Jest, React Testing Library, Cypress"],
+                    ["Backend (Basic):", "Node.js, Express, REST APIs"]
+                ]),
+                ("spacer", "small"),
+            ]),
+            ("Work Experience", [
+                ("paragraph", "<b>Senior Frontend Developer</b> | DesignCo Studios | 2022 - Present"),
+                ("bullets", [
+                    "Built responsive web applications using React and TypeScript for 50+ clients",
+                    "Implemented pixel-perfect designs from Figma mockups with 99% accuracy",
+                    "Optimized application performance, achieving 95+ Lighthouse scores",
+                    "Collaborated with UX designers to improve user flows and accessibility",
+                    "Mentored 2 junior developers in React best practices",
+                ]),
+                ("spacer", "small"),
+                ("paragraph", "<b>Frontend Developer</b> | WebSolutions Inc. | 2020 - 2022"),
+                ("bullets", [
+                    "Developed interactive dashboards using React and Material-UI",
+                    "Integrated RESTful APIs with frontend applications",
+                    "Implemented state management using Redux and Context API",
+                    "Created reusable component library used across 5 projects",
+                    "Basic Node.js backend work for simple CRUD operations",
+                ]),
+                ("spacer", "small"),
+            ]),
+            ("Education", [
+                ("paragraph",
+                 "<b>Bachelor of Arts in Digital Media</b><br/>"
+                 "New York University | 2016 - 2020<br/>"
+                 "Minor in Computer Science"),
+                ("spacer", "small"),
+            ]),
+            ("Certifications & Courses", [
+                ("bullets", [
+                    "Meta Frontend Developer Professional Certificate (2023)",
+                    "Advanced React Patterns Course (2022)",
+                    "Introduction to Python Programming (Coursera, 2021)",
+                    "UX Design Fundamentals (2020)",
+                ]),
+                ("spacer", "small"),
+            ]),
+            ("Notable Projects", [
+                ("bullets", [
+                    "<b>E-commerce Platform:</b> Built complete frontend using Next.js and Stripe integration",
+                    "<b>Dashboard Application:</b> Real-time data visualization with Chart.js and React",
+                    "<b>Portfolio Generator:</b> SaaS tool for creating developer portfolios (React + Firebase)",
+                ]),
+            ]),
+        ],
+    },
+]
+
+
+# --- Builder ---
+
+def _emit_paragraph(story, text):
+    story.append(Paragraph(text, _STYLES['Normal']))
+
+
+def _emit_bullets(story, items):
+    # One Paragraph per item; ReportLab draws the bullet itself
+    for item in items:
+        story.append(Paragraph(item, _BULLET_STYLE, bulletText="•"))
+
+
+def _emit_table(story, rows):
+    table = Table(rows, colWidths=[1.5*inch, 4.5*inch])
+    table.setStyle(_SKILLS_TABLE_STYLE)
+    story.append(table)
+
+
+def _emit_spacer(story, size):
+    story.append(_LARGE_SPACER if size == "large" else _SMALL_SPACER)
+
+
+_EMITTERS = {
+    "paragraph": _emit_paragraph,
+    "bullets": _emit_bullets,
+    "table": _emit_table,
+    "spacer": _emit_spacer,
+}
+
+
+def _resume_story(spec):
+    """Return the flowables for one resume spec in RESUMES."""
     
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=6,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=6,
-        spaceBefore=12
-    )
     
     # Header
-    story.append(Paragraph("John Smith", title_style))
-    story.append(Paragraph("Backend Engineer", styles['Normal']))
-    story.append(Paragraph("Email: john.smith@example.com | Phone: +1 (555) 123-4567", styles['Normal']))
-    story.append(Paragraph("GitHub: github.com/johnsmith | LinkedIn: linkedin.com/in/johnsmith", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Summary
-    story.append(Paragraph("Professional Summary", heading_style))
-    story.append(Paragraph(
-        "Experienced Backend Engineer with 5+ years building scalable microservices and "
-        "distributed systems. Proven expertise in Python, TypeScript, AWS, and Docker. "
-        "Passionate about open-source contributions and infrastructure as code. "
-        "Strong track record of delivering high-performance backend solutions in fast-paced environments.",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Technical Skills
-    story.append(Paragraph("Technical Skills", heading_style))
-    skills_data = [
-        ["Languages:", "Python, TypeScript, JavaScript, Go"],
-        ["Cloud & DevOps:", "AWS (EC2, Lambda, S3, RDS, CloudFormation), Docker, Kubernetes"],
-        ["Infrastructure:", "Terraform, Ansible, CI/CD (GitHub Actions, Jenkins)"],
-        ["Databases:", "PostgreSQL, MongoDB, Redis, DynamoDB"],
-        ["Frameworks:", "FastAPI, Django, Express.js, Node.js"],
-        ["Other:", "Microservices, RESTful APIs, GraphQL, Message Queues (RabbitMQ, SQS)"]
-    ]
+    story.append(Paragraph(spec["name"], _TITLE_STYLE))
+    story.append(Paragraph(spec["title"], _STYLES['Normal']))
+    for line in spec["contact"]:
+        story.append(Paragraph(line, _STYLES['Normal']))
+    story.append(_LARGE_SPACER)
     
-    skills_table = Table(skills_data, colWidths=[1.5*inch, 4.5*inch])
-    skills_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ]))
-    story.append(skills_table)
-    story.append(Spacer(1, 0.1*inch))
+    # Sections
+    for heading, blocks in spec["sections"]:
+        story.append(Paragraph(heading, _HEADING_STYLE))
+        for kind, value in blocks:
+            _EMITTERS[kind](story, value)
     
-    # Work Experience
-    story.append(Paragraph("Work Experience", heading_style))
-    
-    story.append(Paragraph("<b>Senior Backend Engineer</b> | TechCorp Inc. | 2021 - Present", styles['Normal']))
-    story.append(Paragraph(
-        "• Architected and deployed Python microservices handling 10M+ daily requests using FastAPI and AWS Lambda<br/>"
-        "• Reduced infrastructure costs by 40% through optimization of AWS resources and containerization with Docker<br/>"
-        "• Implemented Infrastructure as Code using Terraform, managing 50+ AWS resources across multiple environments<br/>"
-        "• Led migration from monolith to microservices architecture, improving deployment frequency by 300%<br/>"
-        "• Mentored junior developers and contributed to open-source projects (3 major PRs accepted)",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("<b>Backend Developer</b> | DataFlow Systems | 2019 - 2021", styles['Normal']))
-    story.append(Paragraph(
-        "• Developed RESTful APIs using Django and PostgreSQL serving 1M+ users<br/>"
-        "• Implemented real-time data processing pipelines using AWS Kinesis and Lambda<br/>"
-        "• Set up CI/CD pipelines with GitHub Actions, reducing deployment time by 60%<br/>"
-        "• Integrated third-party services and managed Docker containerization<br/>"
-        "• Collaborated with frontend team using TypeScript and Node.js for BFF layer",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Education
-    story.append(Paragraph("Education", heading_style))
-    story.append(Paragraph(
-        "<b>Bachelor of Science in Computer Science</b><br/>"
-        "University of California, Berkeley | 2015 - 2019<br/>"
-        "GPA: 3.7/4.0",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Open Source & Community
-    story.append(Paragraph("Open Source & Community", heading_style))
-    story.append(Paragraph(
-        "• Active contributor to popular Python packages (FastAPI, SQLAlchemy)<br/>"
-        "• Maintainer of docker-compose-automation tool (500+ GitHub stars)<br/>"
-        "• Speaker at PyCon 2023: 'Building Scalable Microservices with Python'<br/>"
-        "• Regular contributor to AWS CDK documentation",
-        styles['Normal']
-    ))
+    return story
+
+
+def _write_pdf(filename, story):
+    """Render a story into memory and write the finished PDF with a single call."""
     
-    # Build PDF
+    # Platypus does the line wrapping and page breaks these resumes need (each
+    # runs onto a second page); a build takes on the order of 15 ms
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                            rightMargin=72, leftMargin=72,
+                            topMargin=72, bottomMargin=18)
     doc.build(story)
-    print(f"Created: {filename}")
+    filename.write_bytes(buffer.getvalue())
+    return filename
 
 
-def create_sarah_johnson_resume():
-    """Create resume for Sarah Johnson - Frontend Developer (Should score ~3.5/10)"""
+def build_resume(spec, output_dir=OUTPUT_DIR):
+    """Build one resume PDF from a spec in RESUMES and return its path."""
     
-    output_dir = Path(__file__).parent
+    output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    filename = output_dir / "sarah_johnson_resume.pdf"
+    return _write_pdf(output_dir / spec["filename"], _resume_story(spec))
+
+
+def build_combined(specs, output_dir=OUTPUT_DIR, filename="resumes_all.pdf"):
+    """Build every resume into one PDF, one resume per page break, and return its path.
     
-    doc = SimpleDocTemplate(str(filename), pagesize=letter,
-                            rightMargin=72, leftMargin=72,
-                            topMargin=72, bottomMargin=18)
+    A single document pays the PDF header, xref table and font serialization
+    once. The recruiter agent treats each PDF as one candidate, so this is
+    for previewing or sharing the set, not for screening.
+    """
     
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=6,
-        alignment=TA_CENTER
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=6,
-        spaceBefore=12
-    )
-    
-    # Header
-    story.append(Paragraph("Sarah Johnson", title_style))
-    story.append(Paragraph("Frontend Developer", styles['Normal']))
-    story.append(Paragraph("Email: sarah.j@example.com | Phone: +1 (555) 987-6543", styles['Normal']))
-    story.append(Paragraph("Portfolio: sarahjohnson.dev | LinkedIn: linkedin.com/in/sarahjohnson", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Summary
-    story.append(Paragraph("Professional Summary", heading_style))
-    story.append(Paragraph(
-        "Creative Frontend Developer with 4 years of experience building beautiful, responsive "
-        "user interfaces. Expert in React, JavaScript, and modern CSS. Passionate about UX/UI "
-        "design and creating intuitive user experiences. Strong collaboration skills and "
-        "experience working with design teams.",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Technical Skills
-    story.append(Paragraph("Technical Skills", heading_style))
-    skills_data = [
-        ["Languages:", "JavaScript, TypeScript, HTML5, CSS3"],
-        ["Frameworks:", "React, Next.js, Vue.js, Redux, React Query"],
-        ["Styling:", "Tailwind CSS, Material-UI, Styled Components, SASS"],
-        ["Tools:", "Git, Webpack, Vite, npm, Figma"],
-        ["Testing:", "Jest, React Testing Library, Cypress"],
-        ["Backend (Basic):", "Node.js, Express, REST APIs"]
-    ]
-    
-    skills_table = Table(skills_data, colWidths=[1.5*inch, 4.5*inch])
-    skills_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-    ]))
-    story.append(skills_table)
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Work Experience
-    story.append(Paragraph("Work Experience", heading_style))
-    
-    story.append(Paragraph("<b>Senior Frontend Developer</b> | DesignCo Studios | 2022 - Present", styles['Normal']))
-    story.append(Paragraph(
-        "• Built responsive web applications using React and TypeScript for 50+ clients<br/>"
-        "• Implemented pixel-perfect designs from Figma mockups with 99% accuracy<br/>"
-        "• Optimized application performance, achieving 95+ Lighthouse scores<br/>"
-        "• Collaborated with UX designers to improve user flows and accessibility<br/>"
-        "• Mentored 2 junior developers in React best practices",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Paragraph("<b>Frontend Developer</b> | WebSolutions Inc. | 2020 - 2022", styles['Normal']))
-    story.append(Paragraph(
-        "• Developed interactive dashboards using React and Material-UI<br/>"
-        "• Integrated RESTful APIs with frontend applications<br/>"
-        "• Implemented state management using Redux and Context API<br/>"
-        "• Created reusable component library used across 5 projects<br/>"
-        "• Basic Node.js backend work for simple CRUD operations",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Education
-    story.append(Paragraph("Education", heading_style))
-    story.append(Paragraph(
-        "<b>Bachelor of Arts in Digital Media</b><br/>"
-        "New York University | 2016 - 2020<br/>"
-        "Minor in Computer Science",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Certifications & Courses
-    story.append(Paragraph("Certifications & Courses", heading_style))
-    story.append(Paragraph(
-        "• Meta Frontend Developer Professional Certificate (2023)<br/>"
-        "• Advanced React Patterns Course (2022)<br/>"
-        "• Introduction to Python Programming (Coursera, 2021)<br/>"
-        "• UX Design Fundamentals (2020)",
-        styles['Normal']
-    ))
-    story.append(Spacer(1, 0.1*inch))
-    
-    # Projects
-    story.append(Paragraph("Notable Projects", heading_style))
-    story.append(Paragraph(
-        "• <b>E-commerce Platform:</b> Built complete frontend using Next.js and Stripe integration<br/>"
-        "• <b>Dashboard Application:</b> Real-time data visualization with Chart.js and React<br/>"
-        "• <b>Portfolio Generator:</b> SaaS tool for creating developer portfolios (React + Firebase)",
-        styles['Normal']
-    ))
-    
-    # Build PDF
-    doc.build(story)
-    print(f"Created: {filename}")
+    for spec in specs:
+        if story:
+            story.append(PageBreak())
+        story.extend(_resume_story(spec))
+    return _write_pdf(output_dir / filename, story)
 
 
 if __name__ == "__main__":
+    if "--combined" in sys.argv[1:]:
+        print("Generating combined resume document...")
+        print(f"Created: {build_combined(RESUMES)}")
+        sys.exit(0)
+    
     print("Generating sample resumes...")
-    create_john_smith_resume()
-    create_sarah_johnson_resume()
+    # Each build is CPU-bound and independent, so run them in separate processes
+    with ProcessPoolExecutor(max_workers=min(len(RESUMES), os.cpu_count() or 1)) as executor:
+        for filename in executor.map(build_resume, RESUMES):
+            print(f"Created: {filename}")
     print("\nResumes generated successfully!")
-    print("\nThese resumes can be used to test the Employee Recruiter Agent.")
-    print("John Smith should score ~7.5/10 (selected for backend role)")
-    print("Sarah Johnson should score ~3.5/10 (not selected - frontend focus)")
-
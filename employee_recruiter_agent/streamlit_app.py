@@ -6,22 +6,73 @@ Run with: streamlit run streamlit_app.py
 import streamlit as st
 from pathlib import Path
 import sys
-import asyncio
 import os
+import queue
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from importlib.util import spec_from_file_location, module_from_spec
 
-# Get the root directory and add it to the Python path to enable imports
-root_dir = Path(__file__).resolve().parent.parent
-if str(root_dir) not in sys.path:
-    sys.path.insert(0, str(root_dir))
+# Resolve this file's location once; add the root directory to the Python path to enable imports
+_HERE = Path(__file__).resolve().parent
+_ROOT = _HERE.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
 
-# Import the agent's functions
+# The agent module (agno, OpenAI client, PyMuPDF) is only imported when
+# candidates are processed, keeping it off the app's first paint
 agent_module_name = "employee_recruiter_agent.employee_recruiter_agent"
-agent_file_path = Path(__file__).resolve().parent / "employee_recruiter_agent.py"
-spec = spec_from_file_location(agent_module_name, agent_file_path)
-agent_module = module_from_spec(spec)
-spec.loader.exec_module(agent_module)
-process_candidates = agent_module.process_candidates
+agent_file_path = _HERE / "employee_recruiter_agent.py"
+
+# Uploaded resumes only need to live for one run, so write them to RAM-backed
+# /dev/shm when available (None falls back to the system temp dir)
+_UPLOAD_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Candidate statuses that count as selected for an interview
+_SELECTED_STATUSES = frozenset({"email_sent", "scheduled", "selected"})
+
+
+@st.cache_resource(show_spinner=False)
+def _agent_slot():
+    """Hold the most recently loaded agent module across sessions and reruns."""
+    return {}
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_agent(api_key):
+    """Load the agent module once per API key instead of on every rerun.
+
+    The module reads OPENROUTER_API_KEY at import, so a new key entered in
+    the sidebar needs a fresh module. The key lives in os.environ and is
+    shared by every session, so only the latest module is kept and the one
+    it replaces has its HTTP connection pool closed.
+    """
+    spec = spec_from_file_location(agent_module_name, agent_file_path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    slot = _agent_slot()
+    previous = slot.get("module")
+    if previous is not None:
+        previous.close_http_pool()
+    slot["module"] = module
+    return module
+
+
+@st.cache_resource(show_spinner=False)
+def _event_loop():
+    """Start a long-lived event loop on a background thread and return it.
+
+    Reusing one loop across clicks keeps the agent's pooled HTTP connections
+    (and their TLS sessions) alive between runs, unlike asyncio.run. Every
+    session submits its run to this loop, so concurrent runs interleave.
+    """
+    import asyncio
+    
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="recruiter-event-loop", daemon=True).start()
+    return loop
 
 
 # Page config
@@ -38,19 +89,37 @@ if "processing" not in st.session_state:
     st.session_state.processing = False
 
 
+_REQUIRED_KEYS = ("OPENROUTER_API_KEY",)
+
+
+def _save_upload(uploaded_file):
+    """Write an uploaded resume to a temp file and return its path."""
+    with tempfile.NamedTemporaryFile(
+        "wb",
+        delete=False,
+        dir=_UPLOAD_DIR,
+        prefix=f"{Path(uploaded_file.name).stem}_",
+        suffix=".pdf"
+    ) as f:
+        try:
+            # Stream in 1 MiB chunks rather than materializing the whole file
+            uploaded_file.seek(0)
+            shutil.copyfileobj(uploaded_file, f, length=1 << 20)
+        except Exception:
+            # Don't leave a partial file behind
+            f.close()
+            os.remove(f.name)
+            raise
+    return f.name
+
+
 def check_api_keys():
     """Check if required API keys are set."""
-    required_keys = ["OPENROUTER_API_KEY"]
-    missing_keys = []
-    
-    for key in required_keys:
-        if key not in st.session_state:
-            if key in os.environ:
-                st.session_state[key] = os.environ[key]
-            else:
-                missing_keys.append(key)
-    
-    return missing_keys
+    # Adopt keys from the environment into session state, then report what is still missing
+    for key in _REQUIRED_KEYS:
+        if key not in st.session_state and key in os.environ:
+            st.session_state[key] = os.environ[key]
+    return [key for key in _REQUIRED_KEYS if key not in st.session_state]
 
 
 def display_results(result, min_score):
@@ -73,13 +142,18 @@ def display_results(result, min_score):
     
     st.markdown("---")
     
-    # Detailed results for each candidate
+    # Detailed results for each candidate; the Next Steps list is built in the same pass
+    selected_summary = []
     if result['results']:
         st.markdown("## Detailed Candidate Reviews")
         
         for i, candidate in enumerate(result['results'], 1):
             # Determine if selected or rejected
-            is_selected = candidate.status in ["email_sent", "scheduled", "selected"]
+            is_selected = candidate.status in _SELECTED_STATUSES
+            if is_selected:
+                selected_summary.append(
+                    f"{len(selected_summary) + 1}. **{candidate.name}** ({candidate.email}) - Score: {candidate.score}/10"
+                )
             
             # Status indicator
             if is_selected:
@@ -89,63 +163,77 @@ def display_results(result, min_score):
                 status_badge = "NOT SELECTED"
                 status_emoji = ":x:"
             
-            # Candidate header
-            st.markdown(f"### {i}. {candidate.name} {status_emoji}")
-            st.markdown(f"**Status:** {status_badge}")
-            st.markdown(f"**Email:** {candidate.email}")
-            st.markdown(f"**Score:** {candidate.score}/10 {'(Meets threshold)' if candidate.score >= min_score else '(Below threshold)'}")
-            
-            # Screening Feedback
-            st.markdown("#### Screening Feedback")
+            # Candidate header (batched into one markdown element)
+            threshold_note = '(Meets threshold)' if candidate.score >= min_score else '(Below threshold)'
+            st.markdown("\n\n".join([
+                f"### {i}. {candidate.name} {status_emoji}",
+                f"**Status:** {status_badge}",
+                f"**Email:** {candidate.email}",
+                f"**Score:** {candidate.score}/10 {threshold_note}",
+                "#### Screening Feedback",
+            ]))
             st.info(candidate.feedback)
             
             # Why selected or not selected
             if is_selected:
-                st.markdown("#### Why Selected?")
-                st.markdown(f"- Score of **{candidate.score}/10** exceeds the minimum threshold of **{min_score}/10**")
-                st.markdown(f"- Demonstrates strong alignment with job requirements")
-                st.markdown(f"- Profile shows relevant skills and experience")
+                st.markdown(
+                    "#### Why Selected?\n"
+                    f"- Score of **{candidate.score}/10** exceeds the minimum threshold of **{min_score}/10**\n"
+                    "- Demonstrates strong alignment with job requirements\n"
+                    "- Profile shows relevant skills and experience"
+                )
             else:
-                st.markdown("#### Why Not Selected?")
-                st.markdown(f"- Score of **{candidate.score}/10** is below the minimum threshold of **{min_score}/10**")
-                st.markdown(f"- See screening feedback above for specific gaps or concerns")
+                st.markdown(
+                    "#### Why Not Selected?\n"
+                    f"- Score of **{candidate.score}/10** is below the minimum threshold of **{min_score}/10**\n"
+                    "- See screening feedback above for specific gaps or concerns"
+                )
             
             # Interview & Email details (if selected)
             if is_selected and candidate.interview_time:
-                st.markdown("#### Interview Details")
-                st.markdown(f"- **Date & Time:** {candidate.interview_time}")
-                st.markdown(f"- **Meeting Link:** [{candidate.meeting_url}]({candidate.meeting_url})")
+                details = [
+                    "#### Interview Details\n"
+                    f"- **Date & Time:** {candidate.interview_time}\n"
+                    f"- **Meeting Link:** [{candidate.meeting_url}]({candidate.meeting_url})"
+                ]
                 
                 # Show email content if available
-                if 'email_contents' in result and candidate.email in result['email_contents']:
-                    email_data = result['email_contents'][candidate.email]
-                    st.markdown("#### Interview Invitation Email")
-                    st.markdown(f"**Subject:** {email_data.get('subject', 'N/A')}")
-                    st.markdown("**Body:**")
+                email_data = result.get('email_contents', {}).get(candidate.email)
+                if email_data:
+                    details += [
+                        "#### Interview Invitation Email",
+                        f"**Subject:** {email_data.get('subject', 'N/A')}",
+                        "**Body:**",
+                    ]
+                st.markdown("\n\n".join(details))
+                
+                if email_data:
                     st.code(email_data.get('body', 'N/A'), language="text")
                     st.info("Copy the email content above to send to the candidate")
             
             st.markdown("---")
     
     # Final summary
-    st.markdown("## Next Steps")
-    
-    if result['selected_candidates']:
-        st.markdown(f"**{len(result['selected_candidates'])} candidate(s) selected for interviews:**")
-        
-        for idx, candidate in enumerate(result['selected_candidates'], 1):
-            st.markdown(f"{idx}. **{candidate.name}** ({candidate.email}) - Score: {candidate.score}/10")
-        
-        st.markdown("\n**Action Items:**")
-        st.markdown("- Review the interview schedules above")
-        st.markdown("- Send the invitation emails to selected candidates")
-        st.markdown("- Prepare interview materials based on candidate profiles")
+    if selected_summary:
+        selected_lines = "\n".join(selected_summary)
+        st.markdown(
+            "## Next Steps\n\n"
+            f"**{len(selected_summary)} candidate(s) selected for interviews:**\n\n"
+            f"{selected_lines}\n\n"
+            "**Action Items:**\n"
+            "- Review the interview schedules above\n"
+            "- Send the invitation emails to selected candidates\n"
+            "- Prepare interview materials based on candidate profiles"
+        )
     else:
-        st.markdown(f"**No candidates met the minimum score threshold of {min_score}/10.**")
-        st.markdown("**Suggestions:**")
-        st.markdown("- Consider lowering the score threshold")
-        st.markdown("- Review additional candidates")
-        st.markdown("- Adjust job requirements if needed")
+        st.markdown(
+            "## Next Steps\n\n"
+            f"**No candidates met the minimum score threshold of {min_score}/10.**\n\n"
+            "**Suggestions:**\n"
+            "- Consider lowering the score threshold\n"
+            "- Review additional candidates\n"
+            "- Adjust job requirements if needed"
+        )
 
 
 # Main app
@@ -174,7 +262,7 @@ def main():
         else:
             st.success("API keys configured")
             if st.button("Reset API Keys"):
-                for key in ["OPENROUTER_API_KEY"]:
+                for key in _REQUIRED_KEYS:
                     if key in st.session_state:
                         del st.session_state[key]
                     if key in os.environ:
@@ -231,8 +319,7 @@ Requirements:
     
     if uploaded_files:
         st.success(f"Uploaded {len(uploaded_files)} file(s)")
-        for file in uploaded_files:
-            st.text(f"- {file.name}")
+        st.text("\n".join(f"- {file.name}" for file in uploaded_files))
     
     st.markdown("---")
     
@@ -261,29 +348,34 @@ Requirements:
             st.error("Please upload at least one PDF resume file")
             return
         
-        # Prepare resume sources
         resume_sources = []
         
-        # Process uploaded files
-        upload_dir = Path("tmp/uploads")
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        # Process candidates, listing each one as soon as it is finished
+        live_results = st.empty()
+        finished_lines = []
         
-        for uploaded_file in uploaded_files:
-            # Save the file
-            file_path = upload_dir / uploaded_file.name
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            resume_sources.append(str(file_path.absolute()))
+        def show_finished(candidate):
+            finished_lines.append(
+                f"- **{candidate.name}** - Score: {candidate.score}/10 - {candidate.status.replace('_', ' ')}"
+            )
+            live_results.markdown("\n".join(finished_lines))
         
-        # Process candidates
         with st.spinner("Processing candidates... This may take a few minutes."):
             try:
-                result = asyncio.run(process_recruitment(
+                # Save uploaded files in parallel; every file written is recorded, even
+                # if another save fails, so the finally block below can delete it
+                with ThreadPoolExecutor(max_workers=min(8, len(uploaded_files))) as executor:
+                    saves = [executor.submit(_save_upload, f) for f in uploaded_files]
+                resume_sources.extend(save.result() for save in saves if save.exception() is None)
+                for save in saves:
+                    save.result()
+                
+                result = process_recruitment(
                     resume_sources=resume_sources,
                     job_description=job_description,
-                    min_score=min_score
-                ))
+                    min_score=min_score,
+                    on_result=show_finished
+                )
                 st.session_state.results = result
                 st.session_state.min_score = min_score
                 st.success("Processing complete!")
@@ -292,6 +384,12 @@ Requirements:
                 st.error(f"Error processing candidates: {str(e)}")
                 import traceback
                 st.code(traceback.format_exc())
+            finally:
+                for file_path in resume_sources:
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
     
     # Display results if available
     if st.session_state.results:
@@ -299,14 +397,43 @@ Requirements:
         display_results(st.session_state.results, st.session_state.get("min_score", 5.0))
 
 
-async def process_recruitment(resume_sources, job_description, min_score):
-    """Process candidates and return results."""
-    result = await process_candidates(
-        candidate_resume_paths=resume_sources,
-        job_description=job_description,
-        min_score=min_score
+def process_recruitment(resume_sources, job_description, min_score, on_result=None):
+    """Process candidates on the shared event loop and return results.
+
+    All resumes go to process_candidates in a single call: it already screens
+    them concurrently, dedups identical files and applies one shared
+    concurrency/rate limit, which per-resume calls would bypass. on_result is
+    called in the script thread with each candidate as soon as it is finished.
+    """
+    import asyncio
+    
+    process_candidates = _load_agent(os.environ.get("OPENROUTER_API_KEY")).process_candidates
+    # The pipeline runs on the loop thread, so finished candidates are handed
+    # back through a queue and rendered here, where Streamlit calls are allowed
+    finished = queue.Queue()
+    future = asyncio.run_coroutine_threadsafe(
+        process_candidates(
+            candidate_resume_paths=resume_sources,
+            job_description=job_description,
+            min_score=min_score,
+            on_result=finished.put
+        ),
+        _event_loop()
     )
-    return result
+    try:
+        while True:
+            try:
+                candidate = finished.get(timeout=0.1)
+            except queue.Empty:
+                # Nothing is queued after the run completes, so empty-and-done is final
+                if future.done() and finished.empty():
+                    return future.result()
+                continue
+            if on_result:
+                on_result(candidate)
+    finally:
+        # Cancels the run if this session stops or reruns before it finishes
+        future.cancel()
 
 
 if __name__ == "__main__":